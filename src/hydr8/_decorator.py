@@ -1,34 +1,186 @@
 from __future__ import annotations
 
-import functools
+import copy
 import inspect
-from typing import Any, Callable, Iterator, TypeVar
-
-from ._store import get
-from ._resolver import resolve, resolve_auto
+import sys
+import types
+from typing import Any, Callable, Iterator, Mapping, TypeVar
+
+from . import _store
+from ._store import get, top_keys
+from ._resolver import (
+    Segments,
+    auto_candidates,
+    pick_auto_path,
+    resolve,
+    resolve_keys,
+    split_path,
+)
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+_POSITIONAL_ONLY = inspect.Parameter.POSITIONAL_ONLY
+_POSITIONAL_OR_KEYWORD = inspect.Parameter.POSITIONAL_OR_KEYWORD
+_VAR_POSITIONAL = inspect.Parameter.VAR_POSITIONAL
+_VAR_KEYWORD = inspect.Parameter.VAR_KEYWORD
+
+_CO_VARKEYWORDS = inspect.CO_VARKEYWORDS
+
+# Upper bound on distinct call shapes remembered per decorated function.
+_BIND_CACHE_SIZE = 64
+
+_WRAPPER_ASSIGNMENTS = (
+    "__module__",
+    "__name__",
+    "__qualname__",
+    "__doc__",
+    "__annotations__",
+)
+
+
+def _wraps(wrapper: Callable[..., Any], fn: Callable[..., Any]) -> Any:
+    """A lighter ``functools.update_wrapper`` that skips the ``__dict__`` merge."""
+    for attr in _WRAPPER_ASSIGNMENTS:
+        try:
+            setattr(wrapper, attr, getattr(fn, attr))
+        except AttributeError:
+            pass
+    wrapper.__wrapped__ = fn  # type: ignore[attr-defined]
+    return wrapper
+
+
+def _container_keys(resolved: Mapping[str, Any]) -> frozenset[str]:
+    """Keys of *resolved* whose values are dicts or lists."""
+    return frozenset(
+        key for key, value in resolved.items() if isinstance(value, (dict, list))
+    )
+
+
+def _detach(
+    resolved: Mapping[str, Any], containers: frozenset[str]
+) -> dict[str, Any]:
+    """Copy *resolved* for a caller, deep-copying the *containers* values.
+
+    Leaf values are immutable, so only nested dicts and lists need copying
+    for a callee's mutations to stay out of the cache.
+    """
+    out = dict(resolved)
+    for key in containers:
+        out[key] = copy.deepcopy(out[key])
+    return out
+
+
+# Upper bound on full-node resolves shared across call sites.
+_RESOLVE_CACHE_SIZE = 256
+
+# path -> (config version, resolved dict, container keys) for full-node
+# resolves, shared by every proxy and wrapper that reads the same path.  Only
+# entries for the newest config version are kept: the cache is emptied as
+# soon as a newer version is seen.
+_RESOLVE_CACHE: dict[str, tuple[int, dict[str, Any], frozenset[str]]] = {}
+_RESOLVE_CACHE_VERSION = -1
+
+
+def _resolve_shared(
+    cfg: Any,
+    cfg_version: int,
+    path: str,
+    segments: Segments | None = None,
+) -> tuple[dict[str, Any], frozenset[str]]:
+    global _RESOLVE_CACHE_VERSION
+    if cfg_version > _RESOLVE_CACHE_VERSION:
+        _RESOLVE_CACHE.clear()
+        _RESOLVE_CACHE_VERSION = cfg_version
+    cached = _RESOLVE_CACHE.get(path)
+    if cached is not None and cached[0] == cfg_version:
+        return cached[1], cached[2]
+    resolved = resolve(cfg, path, segments)
+    containers = _container_keys(resolved)
+    if len(_RESOLVE_CACHE) < _RESOLVE_CACHE_SIZE:
+        _RESOLVE_CACHE[path] = (cfg_version, resolved, containers)
+    return resolved, containers
+
+
+def _param_summary(
+    fn: Callable[..., Any],
+) -> tuple[tuple[str, ...], frozenset[str], bool]:
+    """Return ``(positional_names, named_params, has_var_keyword)`` for *fn*.
+
+    Plain functions are read straight off ``__code__``; ``inspect.signature``
+    is only needed for other callables, or when ``__wrapped__`` /
+    ``__signature__`` would make it report a different signature.
+    """
+    if (
+        type(fn) is types.FunctionType
+        and not hasattr(fn, "__wrapped__")
+        and not hasattr(fn, "__signature__")
+    ):
+        code = fn.__code__
+        n_positional = code.co_argcount
+        n_named = n_positional + code.co_kwonlyargcount
+        positional_names = code.co_varnames[:n_positional]
+        named_params = frozenset(code.co_varnames[:n_named])
+        return (
+            positional_names,
+            named_params,
+            bool(code.co_flags & _CO_VARKEYWORDS),
+        )
+
+    sig = inspect.signature(fn)
+    named_params = frozenset(
+        name
+        for name, p in sig.parameters.items()
+        if p.kind not in (_VAR_POSITIONAL, _VAR_KEYWORD)
+    )
+    positional_names = tuple(
+        name
+        for name, p in sig.parameters.items()
+        if p.kind in (_POSITIONAL_ONLY, _POSITIONAL_OR_KEYWORD)
+    )
+    has_var_keyword = any(
+        p.kind is _VAR_KEYWORD for p in sig.parameters.values()
+    )
+    return positional_names, named_params, has_var_keyword
+
 
 class _ConfigProxy:
     """Returned by ``use()``. Acts as both a decorator and a lazy config dict."""
 
+    __slots__ = ("_path", "_segments", "_as_dict", "_scope", "_resolved_token")
+
     def __init__(self, path: str | None, as_dict: str | None, scope: str) -> None:
         self._path = path
+        self._segments = split_path(path) if path is not None else None
         self._as_dict = as_dict
         self._scope = scope
-        self._resolved: dict[str, Any] | None = None
+        # (config version, read-only view of the resolved dict, container
+        # keys) from the last access.  The dict itself is shared through
+        # _RESOLVE_CACHE; the view only guards its top level, so nested
+        # values are copied on the way out.
+        self._resolved_token: (
+            tuple[int, Mapping[str, Any], frozenset[str]] | None
+        ) = None
+
+    def _resolve_token(self) -> tuple[int, Mapping[str, Any], frozenset[str]]:
+        cfg_version = _store._CFG_VERSION
+        token = self._resolved_token
+        if token is not None and token[0] == cfg_version:
+            return token
+        cfg = get()
+        if self._path is None:
+            raise TypeError(
+                "Cannot resolve config as a function without an explicit path. "
+                "Pass a path to use(), e.g. use('db')."
+            )
+        shared, containers = _resolve_shared(
+            cfg, cfg_version, self._path, self._segments
+        )
+        token = (cfg_version, types.MappingProxyType(shared), containers)
+        self._resolved_token = token
+        return token
 
-    def _resolve(self) -> dict[str, Any]:
-        if self._resolved is None:
-            cfg = get()
-            if self._path is None:
-                raise TypeError(
-                    "Cannot resolve config as a function without an explicit path. "
-                    "Pass a path to use(), e.g. use('db')."
-                )
-            self._resolved = resolve(cfg, self._path)
-        return self._resolved
+    def _resolve(self) -> Mapping[str, Any]:
+        return self._resolve_token()[1]
 
     # -- decorator mode --
 
@@ -36,58 +188,172 @@ class _ConfigProxy:
         path = self._path
         as_dict = self._as_dict
         scope = self._scope
-        sig = inspect.signature(fn)
-        param_names = set(sig.parameters)
-        named_params = {
-            name
-            for name, p in sig.parameters.items()
-            if p.kind
-            not in (
-                inspect.Parameter.VAR_POSITIONAL,
-                inspect.Parameter.VAR_KEYWORD,
-            )
-        }
-        has_var_keyword = any(
-            p.kind is inspect.Parameter.VAR_KEYWORD
-            for p in sig.parameters.values()
-        )
+        if path is not None:
+            segments = self._segments
+        else:
+            # Everything about the auto path except the prefix strip is
+            # fixed by the function itself.
+            project, stripped_path, full_path = auto_candidates(fn, scope)
+        # Everything derived from the signature is computed once here so the
+        # wrapper itself only does cheap membership tests.
+        positional_names, named_params, has_var_keyword = _param_summary(fn)
+
+        # (config version, resolved dict, keys holding dicts or lists).
+        # Stored as a single tuple so a concurrent reader never sees a
+        # mismatched set.
+        resolved_cache: tuple[int, dict[str, Any], frozenset[str]] | None = None
+
+        def resolved_config() -> tuple[dict[str, Any], frozenset[str]]:
+            nonlocal resolved_cache
+            # Read the version before the config: if init() races in between,
+            # the cached entry is tagged with the older version and simply
+            # misses next time.  Read the counter directly rather than via
+            # version(): a cache hit then costs no function calls at all.
+            cfg_version = _store._CFG_VERSION
+            cached = resolved_cache
+            if cached is not None and cached[0] == cfg_version:
+                return cached[1], cached[2]
+            cfg = get()
+            if path is None:
+                node_path = pick_auto_path(
+                    project, stripped_path, full_path, top_keys()
+                )
+                node_segments = split_path(node_path)
+            else:
+                node_path, node_segments = path, segments
+            if as_dict is None and not has_var_keyword:
+                # Only keys matching a named parameter can be injected.
+                resolved = resolve_keys(cfg, node_path, named_params, node_segments)
+                containers = _container_keys(resolved)
+            else:
+                resolved, containers = _resolve_shared(
+                    cfg, cfg_version, node_path, node_segments
+                )
+            resolved_cache = (cfg_version, resolved, containers)
+            return resolved, containers
+
+        if as_dict is not None:
+            # Only the as_dict argument is ever injected, so config is needed
+            # exactly when the caller didn't pass it.
+            if as_dict in positional_names:
+                as_dict_slot: int | None = positional_names.index(as_dict)
+            else:
+                as_dict_slot = None
+
+            def as_dict_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if as_dict not in kwargs and (
+                    as_dict_slot is None or len(args) <= as_dict_slot
+                ):
+                    # Hand out a copy so the callee can't mutate the cache.
+                    kwargs[as_dict] = _detach(*resolved_config())
+                return fn(*args, **kwargs)
 
-        @functools.wraps(fn)
-        def wrapper(*args: Any, **kwargs: Any) -> Any:
-            bound = sig.bind_partial(*args, **kwargs)
-            supplied = set(bound.arguments)
+            return _wraps(as_dict_wrapper, fn)
 
-            as_dict_supplied = (
-                as_dict is None
-                or as_dict in supplied
-                or as_dict in kwargs
-            )
-            if named_params <= supplied and as_dict_supplied and not has_var_keyword:
+        if not named_params and not has_var_keyword:
+            # No parameter could ever receive a config value.
+            def passthrough(*args: Any, **kwargs: Any) -> Any:
                 return fn(*args, **kwargs)
 
-            cfg = get()
-            if path is None:
-                resolved = resolve_auto(cfg, fn, scope)
-            else:
-                resolved = resolve(cfg, path)
+            return _wraps(passthrough, fn)
 
-            if as_dict is not None:
-                if as_dict not in supplied and as_dict not in kwargs:
-                    kwargs[as_dict] = resolved
-            else:
+        n_positional = len(positional_names)
+
+        if has_var_keyword:
+            # Any config key may flow into **kwargs, so config is always read
+            # and every key the caller didn't pass is injected.
+            # bound_by_position[n]: names taken by the first n positional args.
+            bound_by_position = tuple(
+                frozenset(positional_names[:n]) for n in range(n_positional + 1)
+            )
+
+            def var_keyword_wrapper(*args: Any, **kwargs: Any) -> Any:
+                resolved, containers = resolved_config()
+                if not args and not kwargs:
+                    if containers:
+                        return fn(**_detach(resolved, containers))
+                    return fn(**resolved)
+                bound = bound_by_position[min(len(args), n_positional)]
                 for key, value in resolved.items():
-                    if key not in supplied and key not in kwargs:
-                        if key in param_names or has_var_keyword:
-                            kwargs[key] = value
+                    if key not in kwargs and key not in bound:
+                        if key in containers:
+                            value = copy.deepcopy(value)
+                        kwargs[key] = value
+                return fn(*args, **kwargs)
+
+            return _wraps(var_keyword_wrapper, fn)
 
+        # The named params that positional args can't cover.
+        kw_only_names = named_params.difference(positional_names)
+        # Without caller kwargs the params left for config depend only on the
+        # positional count: arg_templates[n] is what remains after n args.
+        arg_templates = tuple(
+            positional_names[n:] + tuple(kw_only_names)
+            for n in range(n_positional + 1)
+        )
+        # Call shape (positional count, keyword names) -> named params the
+        # caller left for config to fill.  Empty means config is skipped.
+        bind_cache: dict[tuple[int, frozenset[str]], tuple[str, ...]] = {}
+        # Bound once so the per-call lookup skips the attribute access.
+        bind_lookup = bind_cache.get
+        # The most recent keyword shape and its template.  Call sites tend to
+        # repeat one shape, and comparing kwargs.keys() against it needs no
+        # allocation, unlike building the frozenset key for bind_cache.
+        last_shape: tuple[int, frozenset[str], tuple[str, ...]] | None = None
+
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            nonlocal last_shape
+            n_args = len(args)
+            # Every positional slot is filled: only the keyword side needs
+            # checking, without touching the binding cache.
+            if n_args >= n_positional and kw_only_names <= kwargs.keys():
+                return fn(*args, **kwargs)
+
+            if not kwargs:
+                if not n_args:
+                    # Nothing passed: every injectable key is missing.
+                    resolved, containers = resolved_config()
+                    if containers:
+                        return fn(**_detach(resolved, containers))
+                    return fn(**resolved)
+                missing = arg_templates[min(n_args, n_positional)]
+            else:
+                last = last_shape
+                if last is not None and last[0] == n_args and kwargs.keys() == last[1]:
+                    missing = last[2]
+                else:
+                    shape = (n_args, frozenset(kwargs))
+                    missing = bind_lookup(shape)
+                    if missing is None:
+                        supplied = shape[1].union(positional_names[:n_args])
+                        missing = tuple(
+                            name for name in named_params if name not in supplied
+                        )
+                        if len(bind_cache) < _BIND_CACHE_SIZE:
+                            bind_cache[shape] = missing
+                    last_shape = (n_args, shape[1], missing)
+                if not missing:
+                    return fn(*args, **kwargs)
+
+            resolved, containers = resolved_config()
+            for name in missing:
+                if name in resolved:
+                    value = resolved[name]
+                    if name in containers:
+                        value = copy.deepcopy(value)
+                    kwargs[name] = value
             return fn(*args, **kwargs)
 
-        return wrapper  # type: ignore[return-value]
+        return _wraps(wrapper, fn)
 
     # -- dict-like mode --
 
     def __getitem__(self, key: str) -> Any:
-        return self._resolve()[key]
+        _, resolved, containers = self._resolve_token()
+        value = resolved[key]
+        if key in containers:
+            return copy.deepcopy(value)
+        return value
 
     def __contains__(self, key: object) -> bool:
         return key in self._resolve()
@@ -102,18 +368,34 @@ class _ConfigProxy:
         return self._resolve().keys()
 
     def values(self) -> Any:
-        return self._resolve().values()
+        _, resolved, containers = self._resolve_token()
+        if containers:
+            return _detach(resolved, containers).values()
+        return resolved.values()
 
     def items(self) -> Any:
-        return self._resolve().items()
+        _, resolved, containers = self._resolve_token()
+        if containers:
+            return _detach(resolved, containers).items()
+        return resolved.items()
 
     def __repr__(self) -> str:
         try:
-            return repr(self._resolve())
+            return repr(self._resolve().copy())
         except Exception:
             return f"_ConfigProxy(path={self._path!r})"
 
 
+# Upper bound on proxies shared between identical use(...) calls.
+_PROXY_CACHE_SIZE = 256
+
+# Proxies are stateless apart from a version-checked cache, so identical
+# use(...) calls can share one instance and its resolved dict.  Once full,
+# further use(...) calls get a fresh proxy, so runtime-built paths can't
+# grow the cache (or the interned path strings) without bound.
+_PROXY_CACHE: dict[tuple[str | None, str | None, str], _ConfigProxy] = {}
+
+
 def use(
     path: str | None = None,
     *,
@@ -183,4 +465,16 @@ def use(
             ``"module"`` (default) resolves to the module's config node.
             ``"fn"`` appends the function's qualname.
     """
-    return _ConfigProxy(path, as_dict, scope)
+    key = (path, as_dict, scope)
+    proxy = _PROXY_CACHE.get(key)
+    if proxy is None:
+        if len(_PROXY_CACHE) >= _PROXY_CACHE_SIZE:
+            return _ConfigProxy(path, as_dict, scope)
+        if path is not None:
+            # Dotted paths aren't interned by the compiler; interning makes
+            # every path-keyed cache lookup an identity hit.  Only cached
+            # proxies intern, so the interned set is bounded too.
+            path = sys.intern(path)
+            key = (path, as_dict, scope)
+        proxy = _PROXY_CACHE.setdefault(key, _ConfigProxy(path, as_dict, scope))
+    return proxy
@@ -1,29 +1,181 @@
 from __future__ import annotations
 
-from typing import Any, Callable
+from typing import Any, Callable, Collection, Iterable, Tuple, Union
 
-from omegaconf import DictConfig, OmegaConf
+from omegaconf import MISSING, DictConfig, ListConfig, OmegaConf
+from omegaconf.errors import KeyValidationError
 
+Segments = Tuple[Union[str, int], ...]
 
-def resolve(cfg: DictConfig, path: str) -> dict[str, Any]:
-    """Traverse *cfg* along the dot-separated *path* and return a plain dict.
 
-    Raises ``KeyError`` if any segment is missing.
+# Upper bound on parsed paths kept by split_path.
+_PATH_CACHE_SIZE = 1024
+
+# Parsed form of recently split paths.  Paths can be built at runtime
+# (e.g. use(f"users.{i}")), so once full, new paths are parsed uncached.
+_PATH_CACHE: dict[str, Segments] = {}
+
+
+def split_path(path: str) -> Segments:
+    """Split a config path into the keys used to walk the config.
+
+    Dots separate keys and ``[n]`` indexes into a list, so
+    ``"db.replicas[0].host"`` becomes ``("db", "replicas", 0, "host")``.
+    Results are cached per path string, up to ``_PATH_CACHE_SIZE`` paths.
+    """
+    segments = _PATH_CACHE.get(path)
+    if segments is None:
+        segments = _parse_path(path)
+        if len(_PATH_CACHE) < _PATH_CACHE_SIZE:
+            _PATH_CACHE[path] = segments
+    return segments
+
+
+def _int_index(text: str) -> int | None:
+    """Return *text* as a list index if it spells a (possibly negative) int."""
+    digits = text[1:] if text[:1] == "-" else text
+    # isdecimal, not isdigit: the latter accepts "²", which int() rejects.
+    return int(text) if digits.isdecimal() else None
+
+
+def _other_key_form(key: str | int) -> str | int | None:
+    """Return the int spelled by a str *key*, or the str form of an int."""
+    if isinstance(key, int):
+        return str(key)
+    return _int_index(key)
+
+
+def _parse_path(path: str) -> Segments:
+    segments: list[str | int] = []
+    for part in path.split("."):
+        name, bracket, rest = part.partition("[")
+        if name:
+            segments.append(name)
+        while bracket:
+            index, _, rest = rest.partition("]")
+            position = _int_index(index)
+            segments.append(index if position is None else position)
+            _, bracket, rest = rest.partition("[")
+    return tuple(segments)
+
+
+def _select_segments(cfg: DictConfig, segments: Segments) -> Any:
+    """Walk *cfg* by item access along pre-split *segments*.
+
+    Unlike ``OmegaConf.select`` this does no path parsing.  Returns ``None``
+    if a segment is missing or would index into a leaf value.
     """
-    node = OmegaConf.select(cfg, path, throw_on_missing=True)
+    node: Any = cfg
+    try:
+        for key in segments:
+            if not isinstance(node, (DictConfig, ListConfig)):
+                # Leaves such as strings support item access too, but a path
+                # through one doesn't exist.
+                return None
+            try:
+                node = node[key]
+            except (KeyError, KeyValidationError):
+                # A path doesn't say whether a key is a str or an int:
+                # "items.0" addresses a list element, "users.1" may name an
+                # int YAML key and "[0]" a str one.  Only pay for the other
+                # form when the first one misses.
+                other = _other_key_form(key)
+                if other is None:
+                    return None
+                try:
+                    node = node[other]
+                except KeyValidationError:
+                    return None
+    except (LookupError, TypeError):
+        # Interpolation errors are deliberately not caught here.
+        return None
+    return node
+
+
+def _select_mapping(
+    cfg: DictConfig, path: str, segments: Segments | None = None
+) -> DictConfig:
+    if segments is None:
+        segments = split_path(path)
+    node = _select_segments(cfg, segments)
     if node is None:
         raise KeyError(f"Config path {path!r} not found")
     if not OmegaConf.is_dict(node):
         raise TypeError(
             f"Config path {path!r} resolved to a leaf value, not a mapping"
         )
+    return node
+
+
+def resolve(
+    cfg: DictConfig, path: str, segments: Segments | None = None
+) -> dict[str, Any]:
+    """Traverse *cfg* along the dot-separated *path* and return a plain dict.
+
+    *segments* may be passed as the already-split form of *path* (see
+    :func:`split_path`) to skip re-parsing it.
+
+    Raises ``KeyError`` if any segment is missing.
+    """
+    node = _select_mapping(cfg, path, segments)
     return OmegaConf.to_container(node, resolve=True)  # type: ignore[return-value]
 
 
-def resolve_auto(
-    cfg: DictConfig, fn: Callable[..., Any], scope: str = "module"
+def resolve_keys(
+    cfg: DictConfig,
+    path: str,
+    keys: Iterable[str],
+    segments: Segments | None = None,
 ) -> dict[str, Any]:
-    """Derive the config path from *fn*'s module (and optionally qualname), then resolve.
+    """Like :func:`resolve`, but only materialize the given *keys*.
+
+    Keys absent from the node are skipped, and mandatory ``???`` values come
+    back as ``"???"`` just as :func:`resolve` returns them.  Other keys are
+    never converted, so unrelated (possibly broken) interpolations aren't
+    evaluated.
+    """
+    node = _select_mapping(cfg, path, segments)
+    out: dict[str, Any] = {}
+    for key in keys:
+        if key in node:
+            value = node[key]
+            if OmegaConf.is_config(value):
+                value = OmegaConf.to_container(value, resolve=True)
+            out[key] = value
+        elif OmegaConf.is_missing(node, key):
+            # ``in`` reports mandatory values as absent.
+            out[key] = MISSING
+    return out
+
+
+def auto_candidates(
+    fn: Callable[..., Any], scope: str = "module"
+) -> tuple[str | None, str, str]:
+    """Return ``(project, stripped_path, full_path)`` for auto-resolving *fn*.
+
+    *project* is the first segment of ``__module__`` (``None`` when the module
+    has no dot) and *stripped_path* is the path without it.  Which of the two
+    paths applies depends on the config, so :func:`pick_auto_path` picks one
+    at lookup time; everything else can be computed once per function.
+    """
+    module = fn.__module__
+    head, sep, tail = module.partition(".")
+    if scope == "fn":
+        qualname = fn.__qualname__
+        module = f"{module}.{qualname}"
+        tail = f"{tail}.{qualname}"
+    if not sep:
+        return None, module, module
+    return head, tail, module
+
+
+def auto_path(
+    cfg: DictConfig,
+    fn: Callable[..., Any],
+    scope: str = "module",
+    top_keys: Collection[str] | None = None,
+) -> str:
+    """Derive the config path for *fn* from its module (and optionally qualname).
 
     If the first segment of ``__module__`` is not a top-level key in *cfg*,
     it is assumed to be the project/package name and is stripped.  This makes
@@ -38,17 +190,32 @@ def resolve_auto(
     When *scope* is ``"fn"``, the function's ``__qualname__`` is appended::
 
         myproject.data.loaders + build_loader -> data.loaders.build_loader
+
+    *top_keys* may be passed as the (cached) top-level keys of *cfg*, so the
+    prefix check doesn't go through ``DictConfig.__contains__``.
     """
-    parts = fn.__module__.split(".")
+    project, stripped_path, full_path = auto_candidates(fn, scope)
+    return pick_auto_path(
+        project, stripped_path, full_path, cfg if top_keys is None else top_keys
+    )
 
+
+def pick_auto_path(
+    project: str | None,
+    stripped_path: str,
+    full_path: str,
+    top_keys: Collection[str],
+) -> str:
+    """Choose between :func:`auto_candidates` paths given the top-level keys."""
     # If the first segment isn't a top-level config key, it's the project
     # name — strip it.
-    if len(parts) > 1 and parts[0] not in cfg:
-        parts = parts[1:]
+    if project is not None and project not in top_keys:
+        return stripped_path
+    return full_path
 
-    if scope == "fn":
-        path = ".".join(parts) + "." + fn.__qualname__
-    else:
-        path = ".".join(parts)
 
-    return resolve(cfg, path)
+def resolve_auto(
+    cfg: DictConfig, fn: Callable[..., Any], scope: str = "module"
+) -> dict[str, Any]:
+    """Resolve the config node for *fn* using the path from :func:`auto_path`."""
+    return resolve(cfg, auto_path(cfg, fn, scope))
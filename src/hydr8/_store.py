@@ -1,38 +1,78 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
-from typing import Any, Iterator
+from typing import Any, Iterator, NoReturn
 
 from omegaconf import DictConfig, OmegaConf
 
 _CFG: DictConfig | None = None
+# Bumped whenever _CFG is rebound, so callers can cache values derived from
+# the config and cheaply tell when they have gone stale.
+_CFG_VERSION: int = 0
+# Top-level keys of _CFG, kept alongside it for cheap membership tests.
+_CFG_TOP_KEYS: frozenset[str] = frozenset()
+
+
+def _install(cfg: DictConfig | None) -> None:
+    global _CFG, _CFG_TOP_KEYS, _CFG_VERSION
+    _CFG = cfg
+    _CFG_TOP_KEYS = frozenset(cfg.keys()) if cfg is not None else frozenset()
+    # Bump last: a reader that saw the old version may pair it with the new
+    # config, which only causes an extra cache miss later.
+    _CFG_VERSION += 1
 
 
 def init(cfg: DictConfig) -> None:
     """Store the Hydra config globally."""
-    global _CFG
-    _CFG = cfg
+    _install(cfg)
+
+
+def _raise_not_initialized() -> NoReturn:
+    raise RuntimeError(
+        "hydr8 config not initialized. Call init(cfg) first."
+    )
 
 
 def get() -> DictConfig:
     """Retrieve the stored config. Raises RuntimeError if uninitialized."""
+    cfg = _CFG
+    if cfg is None:
+        _raise_not_initialized()
+    return cfg
+
+
+def version() -> int:
+    """Return a counter that increases every time the stored config changes.
+
+    Anything cached from the config is still valid as long as this value is
+    unchanged.
+    """
+    return _CFG_VERSION
+
+
+def top_keys() -> frozenset[str]:
+    """Return the stored config's top-level keys, computed once per config.
+
+    Avoids ``DictConfig.__contains__`` when all that's needed is a key test.
+    Raises RuntimeError if uninitialized.
+    """
     if _CFG is None:
-        raise RuntimeError(
-            "hydr8 config not initialized. Call init(cfg) first."
-        )
-    return _CFG
+        _raise_not_initialized()
+    return _CFG_TOP_KEYS
 
 
 @contextmanager
 def override(overrides: dict[str, Any]) -> Iterator[DictConfig]:
-    """Temporarily replace the global config with *overrides* merged in.
+    """Temporarily replace the global config with one built from *overrides*.
 
-    Restores the previous config on exit.
+    The previous config is not merged in; entering and exiting are a plain
+    swap, so the cost doesn't depend on the size of the replaced config.
+    Restores the previous config on exit, including across nested uses.
     """
-    global _CFG
     previous = _CFG
-    _CFG = OmegaConf.create(overrides)
+    cfg = OmegaConf.create(overrides)
+    _install(cfg)
     try:
-        yield _CFG
+        yield cfg
     finally:
-        _CFG = previous
+        _install(previous)
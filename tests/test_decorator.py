@@ -1,18 +1,27 @@
 from __future__ import annotations
 
+import functools
+
 import pytest
 from omegaconf import OmegaConf
 
-from hydr8._store import init
+from hydr8._store import init, override
 import hydr8._store as _store_mod
+import hydr8._decorator as _decorator_mod
 from hydr8._decorator import use
 
 
 @pytest.fixture(autouse=True)
 def _reset_cfg():
-    _store_mod._CFG = None
+    # _install bumps the version, so proxies shared through use() can't
+    # carry a cached resolve from one test into the next.
+    _store_mod._install(None)
+    _decorator_mod._PROXY_CACHE.clear()
+    _decorator_mod._RESOLVE_CACHE.clear()
     yield
-    _store_mod._CFG = None
+    _store_mod._install(None)
+    _decorator_mod._PROXY_CACHE.clear()
+    _decorator_mod._RESOLVE_CACHE.clear()
 
 
 # ---------- basic injection ----------
@@ -75,6 +84,86 @@ def test_as_dict_mode():
     assert result == {"host": "localhost", "port": 5432}
 
 
+def test_as_dict_mutation_does_not_leak():
+    init(OmegaConf.create({"db": {"host": "localhost", "port": 5432}}))
+
+    @use("db", as_dict="config")
+    def connect(config: dict):
+        return config.pop("host")
+
+    assert connect() == "localhost"
+    assert connect() == "localhost"
+
+
+def test_mandatory_missing_injected_in_every_mode():
+    init(OmegaConf.create({"db": {"host": "???"}}))
+
+    @use("db")
+    def named(host="default"):
+        return host
+
+    @use("db", as_dict="config")
+    def whole(config):
+        return config["host"]
+
+    @use("db")
+    def var_keyword(**kwargs):
+        return kwargs["host"]
+
+    assert named() == whole() == var_keyword() == "???"
+
+
+def test_as_dict_nested_mutation_does_not_leak():
+    init(OmegaConf.create({"db": {"opts": {"a": 1}}}))
+
+    @use("db", as_dict="config")
+    def connect(config: dict):
+        config["opts"]["a"] += 1
+        return config["opts"]["a"]
+
+    assert connect() == 2
+    assert connect() == 2
+
+
+def test_injected_list_mutation_does_not_leak():
+    init(OmegaConf.create({"db": {"tags": [1]}}))
+
+    @use("db")
+    def tag(tags):
+        tags.append(2)
+        return tags
+
+    assert tag() == [1, 2]
+    assert tag() == [1, 2]
+
+
+def test_injected_nested_dict_mutation_does_not_leak():
+    init(OmegaConf.create({"db": {"opts": {"a": 1}, "host": "h"}}))
+
+    @use("db")
+    def connect(opts, host):
+        opts["a"] += 1
+        return opts["a"]
+
+    assert connect(host="other") == 2
+    assert connect(host="other") == 2
+    assert connect() == 2
+
+
+def test_var_keyword_nested_mutation_does_not_leak():
+    init(OmegaConf.create({"db": {"opts": {"a": 1}, "tags": [1]}}))
+
+    @use("db")
+    def connect(**kwargs):
+        kwargs["opts"]["a"] += 1
+        kwargs["tags"].append(2)
+        return kwargs["opts"]["a"], kwargs["tags"]
+
+    assert connect() == (2, [1, 2])
+    assert connect() == (2, [1, 2])
+    assert connect(extra=1) == (2, [1, 2])
+
+
 # ---------- auto ----------
 
 
@@ -110,6 +199,121 @@ def test_auto_fn_scope():
     assert process() == 42
 
 
+def test_auto_path_rederived_after_init():
+    # The derived path depends on the config's top-level keys, so it must
+    # be recomputed when a new config is installed.
+    def process(x: int):
+        return x
+
+    process.__module__ = "myproject.data"
+    process = use()(process)
+
+    init(OmegaConf.create({"data": {"x": 1}}))
+    assert process() == 1
+
+    init(OmegaConf.create({"myproject": {"data": {"x": 2}}}))
+    assert process() == 2
+
+
+# ---------- caching ----------
+
+
+def test_resolved_config_refreshed_after_init():
+    init(OmegaConf.create({"db": {"host": "localhost"}}))
+
+    @use("db")
+    def connect(host: str):
+        return host
+
+    assert connect() == "localhost"
+
+    init(OmegaConf.create({"db": {"host": "remote"}}))
+    assert connect() == "remote"
+
+
+def test_resolved_config_refreshed_inside_override():
+    init(OmegaConf.create({"db": {"host": "localhost"}}))
+
+    @use("db")
+    def connect(host: str):
+        return host
+
+    assert connect() == "localhost"
+    with override({"db": {"host": "override-host"}}):
+        assert connect() == "override-host"
+    assert connect() == "localhost"
+
+
+def test_repeated_call_shapes():
+    init(OmegaConf.create({"db": {"host": "localhost", "port": 5432}}))
+
+    @use("db")
+    def connect(host: str, port: int):
+        return host, port
+
+    for _ in range(2):
+        assert connect() == ("localhost", 5432)
+        assert connect(host="remote") == ("remote", 5432)
+        assert connect("remote") == ("remote", 5432)
+        assert connect(port=1) == ("localhost", 1)
+
+    init(OmegaConf.create({"db": {"host": "other", "port": 1234}}))
+    assert connect(host="remote") == ("remote", 1234)
+
+
+def test_full_node_resolved_once_across_call_sites(monkeypatch):
+    init(OmegaConf.create({"db": {"host": "localhost", "port": 5432}}))
+    calls = []
+    real_resolve = _decorator_mod.resolve
+
+    def counting_resolve(*args, **kwargs):
+        calls.append(args[1])
+        return real_resolve(*args, **kwargs)
+
+    monkeypatch.setattr(_decorator_mod, "resolve", counting_resolve)
+
+    @use("db", as_dict="config")
+    def first(config: dict):
+        return config
+
+    @use("db", as_dict="settings")
+    def second(settings: dict):
+        return settings
+
+    assert first() == second() == dict(use("db"))
+    assert calls == ["db"]
+
+
+def test_int_keyed_node():
+    init(OmegaConf.create({"users": {1: {"id": 1}}}))
+
+    @use("users.1")
+    def load(id):
+        return id
+
+    assert load() == 1
+    assert use("users.1")["id"] == 1
+
+
+def test_shared_resolves_dropped_on_new_config():
+    init(OmegaConf.create({"db": {"host": "a"}, "cache": {"ttl": 1}}))
+    assert dict(use("db")) == {"host": "a"}
+    assert dict(use("cache")) == {"ttl": 1}
+    assert set(_decorator_mod._RESOLVE_CACHE) == {"db", "cache"}
+
+    init(OmegaConf.create({"db": {"host": "b"}}))
+    assert dict(use("db")) == {"host": "b"}
+    assert set(_decorator_mod._RESOLVE_CACHE) == {"db"}
+
+
+def test_shared_resolves_are_bounded(monkeypatch):
+    monkeypatch.setattr(_decorator_mod, "_RESOLVE_CACHE_SIZE", 4)
+    init(OmegaConf.create({"users": {str(i): {"id": i} for i in range(10)}}))
+    for i in range(10):
+        assert use(f"users.{i}")["id"] == i
+    assert len(_decorator_mod._RESOLVE_CACHE) == 4
+
+
 # ---------- functools.wraps ----------
 
 
@@ -125,6 +329,43 @@ def test_preserves_metadata():
     assert connect.__doc__ == "Docstring."
 
 
+def test_preserves_qualname_and_wrapped():
+    @use("db")
+    def connect(host: str):
+        return host
+
+    assert connect.__qualname__.endswith("<locals>.connect")
+    assert connect.__wrapped__("direct") == "direct"
+
+
+def test_decorates_partial():
+    init(OmegaConf.create({"db": {"host": "localhost", "port": 5432}}))
+
+    def connect(scheme: str, host: str, port: int):
+        return scheme, host, port
+
+    wrapped = use("db")(functools.partial(connect, "pg"))
+    assert wrapped() == ("pg", "localhost", 5432)
+
+
+def test_decorates_wrapped_function():
+    """Parameters come from the innermost function when stacking decorators."""
+    init(OmegaConf.create({"db": {"host": "localhost", "port": 5432}}))
+
+    def passthrough(f):
+        @functools.wraps(f)
+        def inner(*args, **kwargs):
+            return f(*args, **kwargs)
+        return inner
+
+    @use("db")
+    @passthrough
+    def connect(host: str):
+        return host
+
+    assert connect() == "localhost"
+
+
 # ---------- extra config keys silently ignored ----------
 
 
@@ -140,6 +381,19 @@ def test_extra_config_keys_ignored():
     assert connect() == ("localhost", 5432)
 
 
+def test_unmatched_config_keys_not_resolved():
+    """Only keys matching a parameter are materialized from the config node."""
+    init(OmegaConf.create({
+        "db": {"host": "localhost", "broken": "${nowhere}"},
+    }))
+
+    @use("db")
+    def connect(host: str):
+        return host
+
+    assert connect() == "localhost"
+
+
 # ---------- class method decoration ----------
 
 
@@ -223,6 +477,32 @@ def test_function_items_keys_values():
     assert set(db.items()) == {("host", "localhost"), ("port", 5432)}
 
 
+def test_function_view_is_read_only():
+    init(OmegaConf.create({
+        "db": {"host": "localhost", "opts": {"a": 1}, "tags": [1]},
+    }))
+    db = use("db")
+    with pytest.raises(TypeError):
+        db["host"] = "changed"
+    db["opts"]["a"] = 99
+    db["tags"].append(2)
+    dict(db)["opts"]["a"] = 99
+    dict(db.items())["tags"].append(2)
+    for value in db.values():
+        if isinstance(value, dict):
+            value["a"] = 99
+
+    @use("db")
+    def connect(opts, tags):
+        return opts, tags
+
+    expected = {"host": "localhost", "opts": {"a": 1}, "tags": [1]}
+    assert db["opts"] == {"a": 1}
+    assert dict(use("db")) == expected
+    assert connect() == ({"a": 1}, [1])
+    assert repr(db) == repr(expected)
+
+
 def test_function_no_path_raises():
     init(OmegaConf.create({"a": 1}))
     proxy = use()
@@ -238,6 +518,41 @@ def test_function_lazy_resolution():
     assert db["host"] == "localhost"
 
 
+def test_function_reflects_override():
+    init(OmegaConf.create({"db": {"host": "localhost"}}))
+    db = use("db")
+    assert db["host"] == "localhost"
+
+    with override({"db": {"host": "override-host"}}):
+        assert db["host"] == "override-host"
+
+    assert db["host"] == "localhost"
+
+
+def test_function_proxy_not_initialized_after_override():
+    db = use("db")
+    with override({"db": {"host": "override-host"}}):
+        assert db["host"] == "override-host"
+    with pytest.raises(RuntimeError, match="not initialized"):
+        db["host"]
+
+
+def test_function_proxies_shared():
+    assert use("db") is use("db")
+    assert use("db") is not use("db", as_dict="config")
+
+
+def test_function_proxy_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(_decorator_mod, "_PROXY_CACHE", {})
+    monkeypatch.setattr(_decorator_mod, "_PROXY_CACHE_SIZE", 2)
+    init(OmegaConf.create({"users": {str(i): {"id": i} for i in range(5)}}))
+    for i in range(5):
+        assert use(f"users.{i}")["id"] == i
+    assert len(_decorator_mod._PROXY_CACHE) == 2
+    assert use("users.0") is use("users.0")
+    assert use("users.4") is not use("users.4")
+
+
 # ---------- keyword argument edge cases ----------
 
 
@@ -337,6 +652,14 @@ def test_keyword_only_params():
     assert connect(host="remote") == ("remote", 5432)
 
 
+def test_positional_and_keyword_only_supplied_skips_config():
+    @use("db")
+    def connect(host: str, *, port: int):
+        return host, port
+
+    assert connect("localhost", port=5432) == ("localhost", 5432)
+
+
 def test_default_params_with_kwarg():
     """Config should still inject into params with defaults when not all params supplied."""
     init(OmegaConf.create({"db": {"host": "localhost", "port": 5432}}))
@@ -370,6 +693,34 @@ def test_all_params_supplied_skips_config():
     assert connect(host="localhost", port=5432) == ("localhost", 5432)
 
 
+def test_var_positional_supplied_skips_config():
+    """Extra positionals land in *args without affecting which params are supplied."""
+    @use("db")
+    def connect(host: str, port: int, *rest):
+        return host, port, rest
+
+    assert connect("localhost", 5432, "a", "b") == ("localhost", 5432, ("a", "b"))
+
+
+def test_var_positional_partial_injection():
+    init(OmegaConf.create({"db": {"host": "localhost", "port": 5432}}))
+
+    @use("db")
+    def connect(host: str, port: int, *rest):
+        return host, port, rest
+
+    assert connect("remote") == ("remote", 5432, ())
+
+
+def test_no_injectable_params_skips_config():
+    @use("db")
+    def ping(*args):
+        return args
+
+    assert ping() == ()
+    assert ping(1, 2) == (1, 2)
+
+
 # ---------- **kwargs parameter ----------
 
 
@@ -398,6 +749,18 @@ def test_var_kwargs_with_named_params():
     assert connect(host="remote", extra="val") == ("remote", {"port": 5432, "extra": "val"})
 
 
+def test_var_kwargs_with_positional_arg():
+    """A positionally supplied param is not injected again via **kwargs."""
+    init(OmegaConf.create({"db": {"host": "localhost", "port": 5432}}))
+
+    @use("db")
+    def connect(host: str, **kwargs):
+        return host, kwargs
+
+    assert connect("remote") == ("remote", {"port": 5432})
+    assert connect("remote", extra="val") == ("remote", {"port": 5432, "extra": "val"})
+
+
 def test_var_kwargs_caller_kwarg_passed_through():
     """Caller kwargs that don't match named params pass through to **kwargs."""
     init(OmegaConf.create({"db": {"host": "localhost", "port": 5432}}))
@@ -410,6 +773,14 @@ def test_var_kwargs_caller_kwarg_passed_through():
     assert connect(host="remote", extra="val") == ("remote", 5432, {"extra": "val"})
 
 
+def test_as_dict_positional_supplied_skips_config():
+    @use("db", as_dict="config")
+    def connect(name: str, config: dict):
+        return name, config
+
+    assert connect("mydb", {"custom": True}) == ("mydb", {"custom": True})
+
+
 def test_as_dict_with_var_kwargs():
     """as_dict injects into **kwargs as a named kwarg when the param doesn't exist."""
     init(OmegaConf.create({"db": {"host": "localhost", "port": 5432}}))
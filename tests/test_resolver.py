@@ -2,7 +2,15 @@ from __future__ import annotations
 import pytest
 from omegaconf import OmegaConf
 
-from hydr8._resolver import resolve, resolve_auto
+import hydr8._resolver as _resolver_mod
+from hydr8._resolver import (
+    auto_candidates,
+    auto_path,
+    resolve,
+    resolve_auto,
+    resolve_keys,
+    split_path,
+)
 
 
 # ---------- resolve() ----------
@@ -32,6 +40,93 @@ def test_resolve_leaf_raises():
         resolve(cfg, "db.host")
 
 
+def test_resolve_dotted_list_index():
+    cfg = OmegaConf.create({"db": {"foo": [{"host": "a"}, {"host": "b"}]}})
+    assert resolve(cfg, "db.foo.1") == {"host": "b"}
+
+
+def test_resolve_through_leaf_raises_not_found():
+    cfg = OmegaConf.create({"db": {"host": "localhost"}})
+    with pytest.raises(KeyError, match="not found"):
+        resolve(cfg, "db.host.port")
+
+
+def test_resolve_index_into_leaf_raises_not_found():
+    cfg = OmegaConf.create({"db": {"host": "localhost"}})
+    with pytest.raises(KeyError, match="not found"):
+        resolve(cfg, "db.host[0]")
+
+
+def test_resolve_interpolation_error_propagates():
+    cfg = OmegaConf.create({"db": "${nowhere}"})
+    with pytest.raises(Exception, match="nowhere"):
+        resolve(cfg, "db")
+
+
+# ---------- split_path() ----------
+
+
+def test_split_path():
+    assert split_path("db") == ("db",)
+    assert split_path("db.postgres") == ("db", "postgres")
+    assert split_path("db.foo[2]") == ("db", "foo", 2)
+    assert split_path("a[0][1].b") == ("a", 0, 1, "b")
+    assert split_path("db.foo[-1]") == ("db", "foo", -1)
+    assert split_path("a[²]") == ("a", "²")
+
+
+def test_split_path_cached():
+    assert split_path("db.foo[2]") is split_path("db.foo[2]")
+
+
+def test_split_path_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(_resolver_mod, "_PATH_CACHE", {})
+    monkeypatch.setattr(_resolver_mod, "_PATH_CACHE_SIZE", 2)
+    for i in range(5):
+        assert split_path(f"users.{i}") == ("users", str(i))
+    assert len(_resolver_mod._PATH_CACHE) == 2
+
+
+# ---------- resolve_keys() ----------
+
+
+def test_resolve_keys_subset():
+    cfg = OmegaConf.create({"db": {"host": "localhost", "port": 5432, "user": "admin"}})
+    result = resolve_keys(cfg, "db", {"host", "port"})
+    assert result == {"host": "localhost", "port": 5432}
+
+
+def test_resolve_keys_skips_absent():
+    cfg = OmegaConf.create({"db": {"host": "localhost"}})
+    result = resolve_keys(cfg, "db", {"host", "port"})
+    assert result == {"host": "localhost"}
+
+
+def test_resolve_keys_converts_nested_and_interpolations():
+    cfg = OmegaConf.create({
+        "base": "localhost",
+        "db": {"host": "${base}", "replicas": [{"host": "${base}"}]},
+    })
+    result = resolve_keys(cfg, "db", {"host", "replicas"})
+    assert result == {"host": "localhost", "replicas": [{"host": "localhost"}]}
+
+
+def test_resolve_keys_ignores_unrequested_interpolations():
+    cfg = OmegaConf.create({"db": {"host": "localhost", "broken": "${nowhere}"}})
+    assert resolve_keys(cfg, "db", {"host"}) == {"host": "localhost"}
+
+
+def test_resolve_keys_keeps_mandatory_missing():
+    cfg = OmegaConf.create({"db": {"host": "???", "port": 5432}})
+    assert resolve_keys(cfg, "db", {"host", "port"}) == resolve(cfg, "db")
+
+
+def test_resolve_keys_missing_path_raises():
+    cfg = OmegaConf.create({"db": {"host": "localhost"}})
+    with pytest.raises(KeyError, match="not found"):
+        resolve_keys(cfg, "missing", {"host"})
+
+
 # ---------- resolve_auto() ----------
 
 
@@ -52,6 +147,32 @@ def test_resolve_list_index():
     assert result == {"host": "c", "port": 5432}
 
 
+def test_resolve_int_keyed_node():
+    cfg = OmegaConf.create({"users": {1: {"id": 1}}})
+    assert resolve(cfg, "users.1") == {"id": 1}
+    assert resolve(cfg, "users[1]") == {"id": 1}
+
+
+def test_resolve_bracketed_str_key():
+    cfg = OmegaConf.create({"db": {"0": {"host": "a"}}})
+    assert resolve(cfg, "db[0]") == {"host": "a"}
+    assert resolve(cfg, "db.0") == {"host": "a"}
+
+
+def test_resolve_non_decimal_digit_raises_not_found():
+    cfg = OmegaConf.create({"lst": [{"host": "a"}]})
+    with pytest.raises(KeyError, match="not found"):
+        resolve(cfg, "lst.²")
+    with pytest.raises(KeyError, match="not found"):
+        resolve(cfg, "lst[²]")
+
+
+def test_resolve_negative_list_index():
+    cfg = OmegaConf.create({"db": {"foo": [{"host": "a"}, {"host": "b"}]}})
+    assert resolve(cfg, "db.foo[-1]") == {"host": "b"}
+    assert resolve(cfg, "db.foo.-2") == {"host": "a"}
+
+
 # ---------- resolve_auto() scope="module" (default) ----------
 
 
@@ -105,6 +226,36 @@ def test_resolve_auto_fn_scope_without_project_prefix():
     assert result == {"batch_size": 32}
 
 
+# ---------- auto_path() ----------
+
+
+def test_auto_path_uses_given_top_keys():
+    cfg = OmegaConf.create({"data": {}})
+    fn = _make_fn("myproject.data.loaders", "build_loader")
+    assert auto_path(cfg, fn) == "data.loaders"
+    assert auto_path(cfg, fn, top_keys={"myproject"}) == "myproject.data.loaders"
+
+
+def test_auto_candidates():
+    fn = _make_fn("myproject.data.loaders", "build_loader")
+    assert auto_candidates(fn) == ("myproject", "data.loaders", "myproject.data.loaders")
+    assert auto_candidates(fn, scope="fn") == (
+        "myproject",
+        "data.loaders.build_loader",
+        "myproject.data.loaders.build_loader",
+    )
+
+
+def test_auto_candidates_single_segment_module():
+    fn = _make_fn("loaders", "build_loader")
+    assert auto_candidates(fn) == (None, "loaders", "loaders")
+    assert auto_candidates(fn, scope="fn") == (
+        None,
+        "loaders.build_loader",
+        "loaders.build_loader",
+    )
+
+
 # ---------- resolve_auto() errors ----------
 
 
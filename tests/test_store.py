@@ -3,16 +3,16 @@ from __future__ import annotations
 import pytest
 from omegaconf import OmegaConf
 
-from hydr8._store import get, init, override
+from hydr8._store import get, init, override, top_keys, version
 import hydr8._store as _store_mod
 
 
 @pytest.fixture(autouse=True)
 def _reset_cfg():
     """Reset the global config before each test."""
-    _store_mod._CFG = None
+    _store_mod._install(None)
     yield
-    _store_mod._CFG = None
+    _store_mod._install(None)
 
 
 def test_init_and_get():
@@ -48,3 +48,42 @@ def test_override_nested():
         assert get()["b"] == 2
 
     assert get()["a"] == 1
+
+
+def test_version_bumped_by_init():
+    before = version()
+    init(OmegaConf.create({"a": 1}))
+    assert version() > before
+
+
+def test_version_bumped_by_override_enter_and_exit():
+    init(OmegaConf.create({"a": 1}))
+    before = version()
+
+    with override({"b": 2}):
+        inside = version()
+        assert inside > before
+
+    assert version() > inside
+
+
+def test_top_keys_follow_config():
+    init(OmegaConf.create({"a": 1, "b": 2}))
+    assert top_keys() == {"a", "b"}
+
+    with override({"c": 3}):
+        assert top_keys() == {"c"}
+
+    assert top_keys() == {"a", "b"}
+
+
+def test_top_keys_before_init_raises():
+    with pytest.raises(RuntimeError, match="not initialized"):
+        top_keys()
+
+
+def test_override_replaces_rather_than_merges():
+    init(OmegaConf.create({"a": 1}))
+
+    with override({"b": 2}):
+        assert "a" not in get()